@@ -1,13 +1,54 @@
+import asyncio
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, conint, validator
-from typing import List
+from typing import List, Tuple
 
-from core.game import make_move, count_discs
-from core.ai import find_best_move
+from core.game import make_move
+from core.board import count_discs_bb
+from core.bitboard import board_to_bitboards, generate_moves_both, iter_bits, bit_to_square, popcount
+from core.ai import find_best_move, get_endgame_empties, plays_deterministically
 from core.rules import get_valid_moves
 
-app = FastAPI()
+# Workers are started from a multithreaded server (anyio threads, the
+# default executor), where forking can inherit locks held by other
+# threads, so they come from a forkserver, or spawn where that is missing
+POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# The search is pure Python and holds the GIL, so it runs in worker
+# processes to let concurrent AI requests use every core
+CPU_POOL = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=POOL_CONTEXT)
+
+# Difficulties whose midgame moves split the root across the pool. Off by
+# default: even with the young-brothers-wait bound the split does ~2x the
+# sequential work at expert depth and does not break even on 8 workers,
+# and it occupies every worker with one request. Opt in, e.g. ("expert",),
+# only on hosts with many otherwise idle cores
+PARALLEL_ROOT_DIFFICULTIES: Tuple[str, ...] = ()
+
+# AI replies memoized in the server process, keyed on (board, player,
+# difficulty). Each pool worker has its own search caches, so a re-sent
+# position would otherwise only hit on the worker that searched it
+AI_MOVE_CACHE_SIZE = 8192
+_ai_move_cache: "OrderedDict[tuple, Tuple[int, int]]" = OrderedDict()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    CPU_POOL.shutdown(cancel_futures=True)
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -83,17 +124,22 @@ def move(req: MoveRequest):
 
 
 @app.post("/ai-move")
-def ai_move(req: AIMoveRequest):
-    moves = get_valid_moves(req.board, req.player)
+async def ai_move(req: AIMoveRequest):
+    # Hashable board so repeated positions hit the in-process caches
+    tboard = tuple(tuple(r) for r in req.board)
+    p, o = board_to_bitboards(tboard, req.player)
+
+    # Both sides' moves from one pass: drives pass and game-over handling
+    moves, opponent_moves = generate_moves_both(p, o)
 
     if not moves:
         # Forced pass for AI: check whether opponent has moves.
         opponent = -req.player
-        opponent_moves = get_valid_moves(req.board, opponent)
 
         # If opponent also has no moves -> game over
         if not opponent_moves:
-            counts = count_discs(req.board)
+            black, white = (p, o) if req.player == 1 else (o, p)
+            counts = count_discs_bb(black, white)
             winner = None
             if counts[1] > counts[-1]:
                 winner = 1
@@ -113,13 +159,39 @@ def ai_move(req: AIMoveRequest):
         return {
             "board": req.board,
             "next_player": opponent,
-            "valid_moves": [{"row": r, "col": c} for r, c in opponent_moves],
+            "valid_moves": [
+                {"row": r, "col": c} for r, c in map(bit_to_square, iter_bits(opponent_moves))
+            ],
             "game_over": False,
             "winner": None,
             "move": None,
         }
 
-    row, col = find_best_move(req.board, req.player, req.difficulty)
+    key = (tboard, req.player, req.difficulty)
+    cached = _ai_move_cache.get(key)
+    if cached is not None:
+        _ai_move_cache.move_to_end(key)
+        row, col = cached
+    else:
+        loop = asyncio.get_running_loop()
+        filled = popcount(p | o)
+        if req.difficulty in PARALLEL_ROOT_DIFFICULTIES and 64 - filled > get_endgame_empties(req.difficulty):
+            # Midgame root split: coordinate from a thread, the subtrees run on
+            # CPU_POOL. Endgame solves stay in the pool so they never hold the
+            # server's GIL
+            row, col = await loop.run_in_executor(
+                None, find_best_move, tboard, req.player, req.difficulty, CPU_POOL
+            )
+        else:
+            row, col = await loop.run_in_executor(
+                CPU_POOL, find_best_move, tboard, req.player, req.difficulty
+            )
+
+        # Random opening replies are not cached so they stay random
+        if plays_deterministically(filled, req.difficulty):
+            _ai_move_cache[key] = (row, col)
+            if len(_ai_move_cache) > AI_MOVE_CACHE_SIZE:
+                _ai_move_cache.popitem(last=False)
 
     try:
         result = make_move(req.board, req.player, row, col)
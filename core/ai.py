@@ -1,87 +1,260 @@
-from typing import List, Tuple, Optional
+from concurrent.futures import Executor
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, List, Sequence, Tuple, Optional
 import random
 from core.rules import get_valid_moves
-from core.board import apply_move
-from core.evaluation import evaluate_position
+from core.bitboard import board_to_bitboards, generate_moves, flip, iter_bits, bit_to_square, popcount
+from core.evaluation import evaluate_bb
+from core.zobrist import ZOBRIST_SIDE, zobrist_hash, update_hash, side_of
+from core.endgame import ENDGAME_THRESHOLD, endgame_solve
+from core.opening_book import BOOK_MAX_DISCS, book_move
 
 
-def minimax_alpha_beta(
-    board: List[List[int]], 
-    player: int, 
-    depth: int, 
-    alpha: float = float('-inf'), 
-    beta: float = float('inf'),
-    maximizing_player: bool = True
+# Integer search bounds; comfortably outside any evaluation score
+SCORE_INF = 10 ** 9
+
+# Transposition table bound flags
+TT_EXACT = 0
+TT_LOWER = 1
+TT_UPPER = 2
+
+# Half-width of the aspiration window used by iterative deepening
+ASPIRATION_WINDOW = 50.0
+
+# Below expert, openings with this many discs or fewer may get a random move
+RANDOM_OPENING_DISCS = 8
+
+# Leaf evaluations keyed by (p, o). Kept per process, so a pool worker
+# reuses leaves shared between deepening iterations and between moves
+_evaluate_leaf = lru_cache(maxsize=1 << 16)(evaluate_bb)
+
+
+def _static_weight(row: int, col: int) -> int:
+    on_row_edge = row in (0, 7)
+    on_col_edge = col in (0, 7)
+    if on_row_edge and on_col_edge:
+        return 100   # Corner
+    if row in (1, 6) and col in (1, 6):
+        return -50   # X-square
+    if on_row_edge or on_col_edge:
+        return 10    # Edge
+    return 0
+
+
+# Static move-ordering weight per square index (row * 8 + col)
+STATIC_SQUARE_WEIGHT = tuple(_static_weight(r, c) for r in range(8) for c in range(8))
+
+# Square masks grouped by static weight, best first
+_ORDER_MASKS = tuple(
+    sum(1 << i for i, w in enumerate(STATIC_SQUARE_WEIGHT) if w == weight)
+    for weight in sorted(set(STATIC_SQUARE_WEIGHT), reverse=True)
+)
+
+
+def _order_moves(moves: int, tt_move: int, killers: List[int]) -> List[int]:
+    """Order move bits: TT best move, then killer moves, then by static square weight"""
+    ordered = []
+    if tt_move & moves:
+        ordered.append(tt_move)
+        moves ^= tt_move
+    for killer in killers:
+        if killer & moves:
+            ordered.append(killer)
+            moves ^= killer
+    for mask in _ORDER_MASKS:
+        bucket = moves & mask
+        while bucket:
+            move_bit = bucket & -bucket
+            ordered.append(move_bit)
+            bucket ^= move_bit
+    return ordered
+
+
+def _negamax_bb(
+    p: int, o: int, depth: int, alpha: float, beta: float, h: int, side: int,
+    tt: Dict[int, tuple], killers: List[List[int]], ply: int
+) -> Tuple[float, int]:
+    """
+    Search kernel: negamax with alpha-beta pruning on (player, opponent) bitboards
+    ``h`` is the Zobrist hash of the node, kept up to date incrementally for ``side`` to move
+    ``tt`` maps hashes to (depth, flag, score, best_move_bit) for this search
+    ``killers`` holds the two most recent cutoff moves for each ``ply``
+    Returns (score, move_bit) where move_bit is 0 when no move was searched
+    """
+    # Base case: reached maximum depth
+    if depth == 0:
+        return _evaluate_leaf(p, o), 0
+
+    alpha_orig = alpha
+    tt_move = 0
+    entry = tt.get(h)
+    if entry is not None:
+        entry_depth, flag, entry_score, tt_move = entry
+        if entry_depth >= depth:
+            if flag == TT_EXACT:
+                return entry_score, tt_move
+            if flag == TT_LOWER:
+                alpha = max(alpha, entry_score)
+            else:
+                beta = min(beta, entry_score)
+            if alpha >= beta:
+                return entry_score, tt_move
+
+    moves = generate_moves(p, o)
+    if not moves:
+        # No moves: game over if the opponent is stuck too, otherwise pass
+        if not generate_moves(o, p):
+            return evaluate_bb(p, o), 0
+        score, _ = _negamax_bb(
+            o, p, depth - 1, -beta, -alpha, h ^ ZOBRIST_SIDE, side ^ 1, tt, killers, ply + 1
+        )
+        return -score, 0
+
+    best_score = -SCORE_INF
+    best_move = 0
+    ply_killers = killers[ply]
+
+    for move_bit in _order_moves(moves, tt_move, ply_killers):
+        flipped = flip(p, o, move_bit)
+        child_hash = update_hash(h, side, move_bit, flipped)
+        score, _ = _negamax_bb(
+            o & ~flipped, p | move_bit | flipped, depth - 1, -beta, -alpha,
+            child_hash, side ^ 1, tt, killers, ply + 1
+        )
+        score = -score
+
+        if score > best_score:
+            best_score = score
+            best_move = move_bit
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    # Alpha-beta pruning; remember the move as a killer for this ply
+                    if ply_killers[0] != move_bit:
+                        ply_killers[1] = ply_killers[0]
+                        ply_killers[0] = move_bit
+                    break
+
+    if best_score <= alpha_orig:
+        flag = TT_UPPER
+    elif best_score >= beta:
+        flag = TT_LOWER
+    else:
+        flag = TT_EXACT
+    tt[h] = (depth, flag, best_score, best_move)
+
+    return best_score, best_move
+
+
+def negamax_search(
+    p: int,
+    o: int,
+    depth: int,
+    alpha: float = -SCORE_INF,
+    beta: float = SCORE_INF,
+    side: int = 0,
+    tt: Optional[Dict[int, tuple]] = None
 ) -> Tuple[float, Optional[Tuple[int, int]]]:
     """
-    Minimax algorithm with alpha-beta pruning
+    Negamax with alpha-beta pruning over (player, opponent) bitboards
+    Scores are from the perspective of the side owning ``p``
+    A fresh transposition table is used unless ``tt`` is given
     Returns (score, best_move)
     """
-    
-    # Base case: reached maximum depth or no moves available
-    moves = get_valid_moves(board, player)
-    if depth == 0 or not moves:
-        return evaluate_position(board, player if maximizing_player else -player), None
-    
-    best_move = None
-    
-    if maximizing_player:
-        max_eval = float('-inf')
-        for move in moves:
-            r, c = move
-            try:
-                new_board, _ = apply_move(board, player, r, c)
-                
-                # Check if opponent has moves, otherwise continue with same player
-                opponent = -player
-                opp_moves = get_valid_moves(new_board, opponent)
-                if opp_moves:
-                    eval_score, _ = minimax_alpha_beta(new_board, opponent, depth - 1, alpha, beta, False)
-                else:
-                    # Opponent has no moves, continue with current player
-                    eval_score, _ = minimax_alpha_beta(new_board, player, depth - 1, alpha, beta, True)
-                
-                if eval_score > max_eval:
-                    max_eval = eval_score
-                    best_move = move
-                
-                alpha = max(alpha, eval_score)
-                if beta <= alpha:
-                    break  # Alpha-beta pruning
-                    
-            except ValueError:
-                continue
-        
-        return max_eval, best_move
-    
-    else:  # Minimizing player
-        min_eval = float('inf')
-        for move in moves:
-            r, c = move
-            try:
-                new_board, _ = apply_move(board, player, r, c)
-                
-                # Check if opponent has moves
-                opponent = -player
-                opp_moves = get_valid_moves(new_board, opponent)
-                if opp_moves:
-                    eval_score, _ = minimax_alpha_beta(new_board, opponent, depth - 1, alpha, beta, True)
-                else:
-                    # Opponent has no moves, continue with current player
-                    eval_score, _ = minimax_alpha_beta(new_board, player, depth - 1, alpha, beta, False)
-                
-                if eval_score < min_eval:
-                    min_eval = eval_score
-                    best_move = move
-                
-                beta = min(beta, eval_score)
-                if beta <= alpha:
-                    break  # Alpha-beta pruning
-                    
-            except ValueError:
-                continue
-        
-        return min_eval, best_move
+    if tt is None:
+        tt = {}
+    killers = [[0, 0] for _ in range(depth + 1)]
+    score, move_bit = _negamax_bb(
+        p, o, depth, alpha, beta, zobrist_hash(p, o, side), side, tt, killers, 0
+    )
+    return score, bit_to_square(move_bit) if move_bit else None
+
+
+def iterative_deepening(
+    p: int,
+    o: int,
+    max_depth: int,
+    side: int = 0,
+    window: float = ASPIRATION_WINDOW,
+    upper: float = SCORE_INF
+) -> Tuple[float, Optional[Tuple[int, int]]]:
+    """
+    Search depths 1..max_depth, sharing the transposition table and killers
+    Each iteration after the first uses an aspiration window around the
+    previous score and re-searches with a full window when it fails
+    Scores are only resolved up to ``upper``: a result >= ``upper`` means
+    "at least upper", which is all a caller with that bound needs
+    Returns (score, best_move) from the deepest iteration
+    """
+    tt: Dict[int, tuple] = {}
+    killers = [[0, 0] for _ in range(max_depth + 1)]
+    h = zobrist_hash(p, o, side)
+
+    score, move_bit = _negamax_bb(p, o, 1, -SCORE_INF, upper, h, side, tt, killers, 0)
+    for depth in range(2, max_depth + 1):
+        beta = min(score + window, upper)
+        alpha = min(score, beta) - window
+        score, move_bit = _negamax_bb(p, o, depth, alpha, beta, h, side, tt, killers, 0)
+        # Failing high against ``upper`` itself already answers the caller
+        if score <= alpha or (score >= beta and beta < upper):
+            score, move_bit = _negamax_bb(p, o, depth, -SCORE_INF, upper, h, side, tt, killers, 0)
+
+    return score, bit_to_square(move_bit) if move_bit else None
+
+
+def _score_root_child(p: int, o: int, depth: int, side: int, bound: float = -SCORE_INF) -> float:
+    """
+    Score of a root child from the root player's point of view (``p`` is the side to reply)
+    The reply is only searched until it is shown to be worth at most ``-bound``
+    to the root, i.e. no better than a sibling that is already scored
+    """
+    if depth == 0:
+        return -evaluate_bb(p, o)
+    score, _ = iterative_deepening(p, o, depth, side=side, upper=-bound)
+    return -score
+
+
+def root_split_search(
+    p: int,
+    o: int,
+    depth: int,
+    executor: Executor,
+    side: int = 0
+) -> Tuple[float, Optional[Tuple[int, int]]]:
+    """
+    Young-brothers-wait root split: the first root move in static order is
+    searched on its own, then its score bounds the siblings searched in
+    parallel on ``executor``, so they only need to prove they are not better
+    Returns (score, best_move)
+    """
+    children = []
+    for move_bit in _order_moves(generate_moves(p, o), 0, []):
+        flipped = flip(p, o, move_bit)
+        children.append((move_bit, o & ~flipped, p | move_bit | flipped))
+    if not children:
+        return negamax_search(p, o, depth, side=side)
+
+    best_move, first_p, first_o = children[0]
+    best_score = executor.submit(_score_root_child, first_p, first_o, depth - 1, side ^ 1).result()
+
+    siblings = children[1:]
+    scores = executor.map(
+        _score_root_child,
+        [child_p for _, child_p, _ in siblings],
+        [child_o for _, _, child_o in siblings],
+        repeat(depth - 1),
+        repeat(side ^ 1),
+        repeat(best_score),
+    )
+
+    # A sibling that fails low against the bound returns at most best_score
+    for (move_bit, _, _), score in zip(siblings, scores):
+        if score > best_score:
+            best_score = score
+            best_move = move_bit
+
+    return best_score, bit_to_square(best_move)
 
 
 def get_ai_difficulty_depth(difficulty: str = "medium") -> int:
@@ -95,9 +268,48 @@ def get_ai_difficulty_depth(difficulty: str = "medium") -> int:
     return difficulty_map.get(difficulty.lower(), 4)
 
 
-def find_best_move(board: List[List[int]], player: int, difficulty: str = "medium") -> Tuple[int, int]:
+def get_endgame_empties(difficulty: str = "medium") -> int:
+    """Empty squares at or below which the AI solves the game exactly"""
+    # Weaker levels only solve once their search would reach the end anyway.
+    # Hard solves at 10 empties (at most ~0.15s) to stay near its depth-6
+    # latency; 12 empties can take over 2s and is left to expert
+    endgame_map = {
+        "easy": 2,
+        "medium": 4,
+        "hard": 10,
+        "expert": ENDGAME_THRESHOLD
+    }
+    return endgame_map.get(difficulty.lower(), 4)
+
+
+def plays_deterministically(filled_squares: int, difficulty: str) -> bool:
+    """Whether find_best_move always answers a position with this many discs the same way"""
+    return filled_squares > RANDOM_OPENING_DISCS or difficulty == "expert"
+
+
+@lru_cache(maxsize=8192)
+def _best_move_cached(
+    board: Tuple[Tuple[int, ...], ...], player: int, depth: int, endgame_empties: int
+) -> Optional[Tuple[int, int]]:
+    """Deterministic search result for a position, memoized for repeated requests"""
+    p, o = board_to_bitboards(board, player)
+    if 64 - popcount(p | o) <= endgame_empties:
+        _, move_bit = endgame_solve(p, o, -64, 64)
+        return bit_to_square(move_bit) if move_bit else None
+    _, best_move = iterative_deepening(p, o, depth, side=side_of(player))
+    return best_move
+
+
+def find_best_move(
+    board: Sequence[Sequence[int]],
+    player: int,
+    difficulty: str = "medium",
+    executor: Optional[Executor] = None
+) -> Tuple[int, int]:
     """
-    Find the best move using minimax with alpha-beta pruning
+    Find the best move using negamax with alpha-beta pruning
+    Accepts a list board or a hashable tuple-of-tuples board
+    With an ``executor`` the root moves are searched in parallel on it
     """
     moves = get_valid_moves(board, player)
     
@@ -106,15 +318,29 @@ def find_best_move(board: List[List[int]], player: int, difficulty: str = "mediu
     
     # For very early game, add some randomness to avoid predictable openings
     filled_squares = sum(1 for row in board for cell in row if cell != 0)
-    if filled_squares <= 8 and difficulty != "expert":
+    if not plays_deterministically(filled_squares, difficulty):
         # In opening, sometimes pick a random good move
         if random.random() < 0.3:  # 30% chance of random move in opening
             return random.choice(moves)
     
+    if not isinstance(board, tuple):
+        board = tuple(tuple(row) for row in board)
+
+    # Known openings are answered from the book without searching
+    if filled_squares <= BOOK_MAX_DISCS:
+        move = book_move(*board_to_bitboards(board, player))
+        if move is not None:
+            return move
+
     depth = get_ai_difficulty_depth(difficulty)
+    endgame_empties = get_endgame_empties(difficulty)
     
-    # Use minimax to find best move
-    _, best_move = minimax_alpha_beta(board, player, depth, maximizing_player=True)
+    # Search on bitboards; repeated positions are served from the cache
+    if executor is not None and 64 - filled_squares > endgame_empties:
+        p, o = board_to_bitboards(board, player)
+        _, best_move = root_split_search(p, o, depth, executor, side=side_of(player))
+    else:
+        best_move = _best_move_cached(board, player, depth, endgame_empties)
     
     # Fallback to random if no move found (shouldn't happen)
     if best_move is None:
@@ -0,0 +1,184 @@
+"""
+Bitboard representation of an Othello position.
+
+A position is a pair of 64-bit integers (player, opponent) where bit
+``row * 8 + col`` is set when that side has a disc on the square.
+Move generation uses directional shift+mask fills, so each direction
+costs a handful of shifts and ANDs instead of a Python scan over the
+8x8 list. Flipping uses the precomputed ray masks in core.flip_table.
+"""
+
+from functools import lru_cache
+from typing import Iterator, List, Sequence, Tuple
+
+from core.flip_table import flip_lookup as flip  # noqa: F401  (re-exported)
+
+FULL = 0xFFFFFFFFFFFFFFFF
+NOT_A_FILE = 0xFEFEFEFEFEFEFEFE
+NOT_H_FILE = 0x7F7F7F7F7F7F7F7F
+
+# Opponent masks per direction: interior columns for anything with a
+# horizontal component so runs cannot wrap from one rank to the next.
+_HORIZONTAL_MASK = 0x7E7E7E7E7E7E7E7E
+_VERTICAL_MASK = 0x00FFFFFFFFFFFF00
+_DIAGONAL_MASK = 0x007E7E7E7E7E7E00
+
+# (shift, opponent mask). Positive shifts move towards higher squares
+# (east / south), negative shifts towards lower squares (west / north).
+SHIFT_MASKS = (
+    (1, _HORIZONTAL_MASK),   # E
+    (-1, _HORIZONTAL_MASK),  # W
+    (8, _VERTICAL_MASK),     # S
+    (-8, _VERTICAL_MASK),    # N
+    (7, _DIAGONAL_MASK),     # SW
+    (-7, _DIAGONAL_MASK),    # NE
+    (9, _DIAGONAL_MASK),     # SE
+    (-9, _DIAGONAL_MASK),    # NW
+)
+
+
+if hasattr(int, "bit_count"):
+    def popcount(x: int) -> int:
+        return x.bit_count()
+else:  # Python < 3.10
+    def popcount(x: int) -> int:
+        return bin(x).count("1")
+
+
+def square_bit(row: int, col: int) -> int:
+    return 1 << (row * 8 + col)
+
+
+def bit_to_square(bit: int) -> Tuple[int, int]:
+    return divmod(bit.bit_length() - 1, 8)
+
+
+def iter_bits(bits: int) -> Iterator[int]:
+    """Yield each set bit of ``bits`` as a single-bit integer, lowest first"""
+    while bits:
+        lsb = bits & -bits
+        yield lsb
+        bits ^= lsb
+
+
+def list_to_bb(board: Sequence[Sequence[int]], player: int) -> Tuple[int, int]:
+    """Convert an 8x8 list board to (player_bb, opponent_bb)"""
+    p = 0
+    o = 0
+    bit = 1
+    for row in board:
+        for cell in row:
+            if cell == player:
+                p |= bit
+            elif cell == -player:
+                o |= bit
+            bit <<= 1
+    return p, o
+
+
+@lru_cache(maxsize=4096)
+def board_to_bitboards(board: Tuple[Tuple[int, ...], ...], player: int) -> Tuple[int, int]:
+    """Memoized list_to_bb for hashable tuple-of-tuples boards"""
+    return list_to_bb(board, player)
+
+
+def bb_to_list(p: int, o: int, player: int = 1) -> List[List[int]]:
+    """Convert (player_bb, opponent_bb) back to an 8x8 list board"""
+    board = []
+    for r in range(8):
+        row = []
+        for c in range(8):
+            bit = 1 << (r * 8 + c)
+            if p & bit:
+                row.append(player)
+            elif o & bit:
+                row.append(-player)
+            else:
+                row.append(0)
+        board.append(row)
+    return board
+
+
+def adjacent(x: int) -> int:
+    """Return every square touching a set bit of ``x`` in any of the 8 directions"""
+    return (
+        ((x << 1) & NOT_A_FILE) | ((x >> 1) & NOT_H_FILE) |
+        (x << 8) | (x >> 8) |
+        ((x << 9) & NOT_A_FILE) | ((x >> 7) & NOT_A_FILE) |
+        ((x << 7) & NOT_H_FILE) | ((x >> 9) & NOT_H_FILE)
+    ) & FULL
+
+
+def generate_moves(p: int, o: int) -> int:
+    """Return a bitboard of every legal move for the side owning ``p``"""
+    empty = ~(p | o) & FULL
+    moves = 0
+
+    for shift, mask in SHIFT_MASKS:
+        om = o & mask
+        if shift > 0:
+            t = (p << shift) & om
+            t |= (t << shift) & om
+            t |= (t << shift) & om
+            t |= (t << shift) & om
+            t |= (t << shift) & om
+            t |= (t << shift) & om
+            moves |= (t << shift) & empty
+        else:
+            s = -shift
+            t = (p >> s) & om
+            t |= (t >> s) & om
+            t |= (t >> s) & om
+            t |= (t >> s) & om
+            t |= (t >> s) & om
+            t |= (t >> s) & om
+            moves |= (t >> s) & empty
+
+    return moves
+
+
+def generate_moves_both(p: int, o: int) -> Tuple[int, int]:
+    """
+    Legal moves for both sides in one pass: (moves for ``p``, moves for ``o``)
+    Shares the empty mask and per-direction masks between the two fills
+    """
+    empty = ~(p | o) & FULL
+    p_moves = 0
+    o_moves = 0
+
+    for shift, mask in SHIFT_MASKS:
+        pm = p & mask
+        om = o & mask
+        if shift > 0:
+            t = (p << shift) & om
+            u = (o << shift) & pm
+            t |= (t << shift) & om
+            u |= (u << shift) & pm
+            t |= (t << shift) & om
+            u |= (u << shift) & pm
+            t |= (t << shift) & om
+            u |= (u << shift) & pm
+            t |= (t << shift) & om
+            u |= (u << shift) & pm
+            t |= (t << shift) & om
+            u |= (u << shift) & pm
+            p_moves |= (t << shift) & empty
+            o_moves |= (u << shift) & empty
+        else:
+            s = -shift
+            t = (p >> s) & om
+            u = (o >> s) & pm
+            t |= (t >> s) & om
+            u |= (u >> s) & pm
+            t |= (t >> s) & om
+            u |= (u >> s) & pm
+            t |= (t >> s) & om
+            u |= (u >> s) & pm
+            t |= (t >> s) & om
+            u |= (u >> s) & pm
+            t |= (t >> s) & om
+            u |= (u >> s) & pm
+            p_moves |= (t >> s) & empty
+            o_moves |= (u >> s) & empty
+
+    return p_moves, o_moves
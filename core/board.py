@@ -1,17 +1,33 @@
-from typing import List, Tuple
-from core.rules import get_flips
+from typing import Dict, List, Tuple
+from core.rules import in_bounds
+from core.bitboard import list_to_bb, square_bit, flip, iter_bits, bit_to_square, popcount
 
 
 def apply_move(board, player, row, col):
-    flips = get_flips(board, player, row, col)
-    if not flips:
+    if not in_bounds(row, col):
+        raise ValueError("Invalid move")
+
+    p, o = list_to_bb(board, player)
+    move_bit = square_bit(row, col)
+    if (p | o) & move_bit:
+        raise ValueError("Invalid move")
+
+    flipped = flip(p, o, move_bit)
+    if not flipped:
         raise ValueError("Invalid move")
 
     new_board = [r[:] for r in board]
     new_board[row][col] = player
 
-    for r, c in flips:
+    flips = []
+    for bit in iter_bits(flipped):
+        r, c = bit_to_square(bit)
         new_board[r][c] = player
+        flips.append((r, c))
 
     return new_board, flips
 
+
+def count_discs_bb(black: int, white: int) -> Dict[int, int]:
+    """Disc counts from black/white bitboards, keyed like count_discs"""
+    return {1: popcount(black), -1: popcount(white), 0: 64 - popcount(black | white)}
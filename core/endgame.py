@@ -0,0 +1,75 @@
+"""
+Exact endgame solver on bitboards.
+
+Once few enough squares are empty the game can be searched to the end
+instead of to a heuristic depth: leaves score the final disc difference,
+so evaluate_bb is never called, and moves are tried fastest-first
+(fewest opponent replies) which prunes well near the end of the game.
+"""
+
+from typing import List, Tuple
+
+from core.bitboard import FULL, popcount, generate_moves, flip
+
+# Solve exactly at the root once this many squares (or fewer) are empty
+ENDGAME_THRESHOLD = 12
+
+# Below this many empties fastest-first ordering costs more than it saves
+_FASTEST_FIRST_EMPTIES = 6
+
+
+def final_score(p: int, o: int) -> int:
+    """Disc difference at game end, empties going to the winner"""
+    my_discs = popcount(p)
+    opp_discs = popcount(o)
+    empties = 64 - my_discs - opp_discs
+    if my_discs > opp_discs:
+        return my_discs - opp_discs + empties
+    if my_discs < opp_discs:
+        return my_discs - opp_discs - empties
+    return 0
+
+
+def _children(p: int, o: int, moves: int, empties: int) -> List[Tuple[int, int, int]]:
+    """(move_bit, child_p, child_o) for each move, fastest-first when worth it"""
+    children = []
+    while moves:
+        move_bit = moves & -moves
+        moves ^= move_bit
+        flipped = flip(p, o, move_bit)
+        children.append((move_bit, o & ~flipped, p | move_bit | flipped))
+
+    if empties > _FASTEST_FIRST_EMPTIES:
+        children.sort(key=lambda child: popcount(generate_moves(child[1], child[2])))
+    return children
+
+
+def endgame_solve(p: int, o: int, alpha: int, beta: int) -> Tuple[int, int]:
+    """
+    Negamax to the end of the game for the side owning ``p``
+    Returns (final disc difference, move_bit); move_bit is 0 on a pass or at game end
+    """
+    moves = generate_moves(p, o)
+    if not moves:
+        if not generate_moves(o, p):
+            return final_score(p, o), 0
+        score, _ = endgame_solve(o, p, -beta, -alpha)
+        return -score, 0
+
+    empties = popcount(~(p | o) & FULL)
+    best_score = -65
+    best_move = 0
+
+    for move_bit, child_p, child_o in _children(p, o, moves, empties):
+        score, _ = endgame_solve(child_p, child_o, -beta, -alpha)
+        score = -score
+
+        if score > best_score:
+            best_score = score
+            best_move = move_bit
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    break
+
+    return best_score, best_move
@@ -0,0 +1,79 @@
+"""
+Precomputed per-square ray masks for flip computation.
+
+For every square and direction the ray of squares out to the board edge
+is stored as one bitmask. The discs flipped along a ray are then the ray
+bits strictly between the move and the first non-opponent square, which
+is found with a single lowest/highest-bit trick instead of walking the
+ray one square at a time.
+"""
+
+from typing import Tuple
+
+_DIRECTIONS = (
+    (0, 1), (1, 0), (1, 1), (1, -1),      # towards higher square indices
+    (0, -1), (-1, 0), (-1, -1), (-1, 1),  # towards lower square indices
+)
+
+
+def _ray(sq: int, dr: int, dc: int) -> Tuple[int, int]:
+    """Return (first square bit, full ray mask) from ``sq`` in direction (dr, dc)"""
+    r, c = divmod(sq, 8)
+    first = 0
+    mask = 0
+    r += dr
+    c += dc
+    while 0 <= r < 8 and 0 <= c < 8:
+        bit = 1 << (r * 8 + c)
+        first = first or bit
+        mask |= bit
+        r += dr
+        c += dc
+    return first, mask
+
+
+def _rays(sq: int, directions) -> Tuple[Tuple[int, int], ...]:
+    # Rays shorter than two squares can never flip anything
+    return tuple(
+        (first, mask) for first, mask in (_ray(sq, dr, dc) for dr, dc in directions)
+        if mask != first
+    )
+
+
+# RAYS_UP[sq] / RAYS_DOWN[sq]: (first square, ray mask) for the rays from
+# ``sq`` that run towards higher / lower square indices
+RAYS_UP: Tuple[Tuple[Tuple[int, int], ...], ...] = tuple(
+    _rays(sq, _DIRECTIONS[:4]) for sq in range(64)
+)
+RAYS_DOWN: Tuple[Tuple[Tuple[int, int], ...], ...] = tuple(
+    _rays(sq, _DIRECTIONS[4:]) for sq in range(64)
+)
+
+
+def flip_lookup(p: int, o: int, move_bit: int) -> int:
+    """Return the bitboard of opponent discs flipped by playing ``move_bit``"""
+    sq = move_bit.bit_length() - 1
+    not_o = ~o
+    flips = 0
+
+    for adjacent, ray in RAYS_UP[sq]:
+        if not o & adjacent:
+            continue
+        # Nearest non-opponent square is the lowest blocker on the ray
+        blockers = ray & not_o
+        if blockers:
+            first = blockers & -blockers
+            if first & p:
+                flips |= ray & (first - 1)
+
+    for adjacent, ray in RAYS_DOWN[sq]:
+        if not o & adjacent:
+            continue
+        # Nearest non-opponent square is the highest blocker on the ray
+        blockers = ray & not_o
+        if blockers:
+            first = 1 << (blockers.bit_length() - 1)
+            if first & p:
+                flips |= ray & ~((first << 1) - 1)
+
+    return flips
@@ -1,6 +1,8 @@
 from typing import List, Optional, Dict
-from core.rules import get_valid_moves
+from core.rules import get_valid_moves_both
 from core.board import apply_move
+from core.bitboard import square_bit
+from core.zobrist import ZOBRIST_SIDE, update_hash, side_of
 
 
 def count_discs(board: List[List[int]]) -> Dict[int, int]:
@@ -16,17 +18,25 @@ def make_move(
     board: List[List[int]],
     player: int,
     row: int,
-    col: int
+    col: int,
+    position_hash: Optional[int] = None
 ):
+    """
+    Play (row, col) for ``player`` and describe the resulting position
+    When ``position_hash`` (the Zobrist hash of ``board`` with ``player`` to
+    move) is given, the result also carries the hash of the new position,
+    updated incrementally from the placed and flipped discs
+    """
     new_board, flips = apply_move(board, player, row, col)
     next_player = -player
 
-    next_moves = get_valid_moves(new_board, next_player)
+    # Both sides' moves from one pass; the mover's are needed on a forced pass
+    next_moves, own_moves = get_valid_moves_both(new_board, next_player)
 
     # Forced pass
     if not next_moves:
         next_player = player
-        next_moves = get_valid_moves(new_board, player)
+        next_moves = own_moves
 
     game_over = not next_moves
     winner: Optional[int] = None
@@ -38,7 +48,7 @@ def make_move(
         elif counts[-1] > counts[1]:
             winner = -1
 
-    return {
+    result = {
         "board": new_board,
         "next_player": next_player,
         "valid_moves": [{"row": r, "col": c} for r, c in next_moves],
@@ -46,3 +56,14 @@ def make_move(
         "winner": winner,
         "flipped": [{"row": r, "col": c} for r, c in flips],
     }
+
+    if position_hash is not None:
+        flipped = 0
+        for r, c in flips:
+            flipped |= square_bit(r, c)
+        new_hash = update_hash(position_hash, side_of(player), square_bit(row, col), flipped)
+        if next_player == player:
+            new_hash ^= ZOBRIST_SIDE  # Forced pass hands the move straight back
+        result["hash"] = new_hash
+
+    return result
@@ -0,0 +1,102 @@
+"""
+Small hand-written opening book.
+
+Positions are stored in a canonical form under the 8 symmetries of the
+board (rotations and reflections), so one line covers all of its mirror
+images. Keys are (side-to-move bitboard, other-side bitboard) pairs; in
+the opening there are no passes, so the disc count fixes the colours.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from core.bitboard import flip
+
+# Notation: file a-h is the column, rank 1-8 is the row. Earlier lines
+# win when two lines reach the same position with different replies.
+OPENING_LINES = (
+    "f5 d6 c3 d3 c4 f4 c5 b3 c2",   # Tiger
+    "f5 f6 e6 f4 e3 c5 c4 e7",      # Diagonal opening, main line
+    "f5 f4 e3 f6 d3",               # Parallel opening
+    "f5 d6 c5 f4 e3 f6",            # Perpendicular, c5 line
+    "f5 f6 e6 d6 c5",               # Diagonal, d6 reply
+)
+
+# No book position has more discs than the longest line reaches
+BOOK_MAX_DISCS = 4 + max(len(line.split()) for line in OPENING_LINES)
+
+_INITIAL = (
+    (1 << (3 * 8 + 4)) | (1 << (4 * 8 + 3)),  # black to move: e4, d5
+    (1 << (3 * 8 + 3)) | (1 << (4 * 8 + 4)),  # white: d4, e5
+)
+
+
+def _transform(r: int, c: int, k: int) -> Tuple[int, int]:
+    """Apply symmetry k (0-7): k & 3 quarter-turns, then a mirror if k & 4"""
+    for _ in range(k & 3):
+        r, c = c, 7 - r
+    if k & 4:
+        c = 7 - c
+    return r, c
+
+
+# SYMMETRIES[k][sq] is the square index sq maps to under symmetry k
+SYMMETRIES = tuple(
+    tuple(r * 8 + c for r, c in (_transform(sq // 8, sq % 8, k) for sq in range(64)))
+    for k in range(8)
+)
+# INVERSE[k][sq] undoes SYMMETRIES[k]
+INVERSE = tuple(
+    tuple(table.index(sq) for sq in range(64))
+    for table in SYMMETRIES
+)
+
+
+def _map_bits(bits: int, table: Tuple[int, ...]) -> int:
+    out = 0
+    while bits:
+        lsb = bits & -bits
+        out |= 1 << table[lsb.bit_length() - 1]
+        bits ^= lsb
+    return out
+
+
+def canonical(p: int, o: int) -> Tuple[Tuple[int, int], int]:
+    """Return the canonical (p, o) key and the symmetry index that produces it"""
+    return min(
+        ((_map_bits(p, table), _map_bits(o, table)), k)
+        for k, table in enumerate(SYMMETRIES)
+    )
+
+
+def _parse(square: str) -> int:
+    return (int(square[1]) - 1) * 8 + (ord(square[0]) - ord("a"))
+
+
+def _build_book() -> Dict[Tuple[int, int], int]:
+    book: Dict[Tuple[int, int], int] = {}
+    for line in OPENING_LINES:
+        p, o = _INITIAL
+        for square in line.split():
+            sq = _parse(square)
+            move_bit = 1 << sq
+            flipped = flip(p, o, move_bit)
+            if not flipped:
+                raise ValueError(f"Illegal book move {square} in line {line!r}")
+
+            key, k = canonical(p, o)
+            book.setdefault(key, SYMMETRIES[k][sq])
+            p, o = o & ~flipped, p | move_bit | flipped
+    return book
+
+
+# Canonical (p, o) -> reply square index in canonical coordinates
+OPENING_BOOK: Dict[Tuple[int, int], int] = _build_book()
+
+
+def book_move(p: int, o: int) -> Optional[Tuple[int, int]]:
+    """Book reply (row, col) for the side owning ``p``, or None when out of book"""
+    key, k = canonical(p, o)
+    sq = OPENING_BOOK.get(key)
+    if sq is None:
+        return None
+    return divmod(INVERSE[k][sq], 8)
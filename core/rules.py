@@ -1,4 +1,8 @@
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
+
+from core.bitboard import (
+    list_to_bb, square_bit, flip, generate_moves, generate_moves_both, iter_bits, bit_to_square
+)
 
 DIRECTIONS = [
     (-1, -1), (-1, 0), (-1, 1),
@@ -11,34 +15,28 @@ def in_bounds(r: int, c: int) -> bool:
     return 0 <= r < 8 and 0 <= c < 8
 
 
-def get_flips(board: List[List[int]], player: int, row: int, col: int) -> List[Tuple[int, int]]:
+def get_flips(board: Sequence[Sequence[int]], player: int, row: int, col: int) -> List[Tuple[int, int]]:
     if not in_bounds(row, col):
         return []
     if board[row][col] != 0:
         return []
 
-    opponent = -player
-    flips = []
-
-    for dr, dc in DIRECTIONS:
-        r, c = row + dr, col + dc
-        line = []
-
-        while in_bounds(r, c) and board[r][c] == opponent:
-            line.append((r, c))
-            r += dr
-            c += dc
+    p, o = list_to_bb(board, player)
+    return [bit_to_square(bit) for bit in iter_bits(flip(p, o, square_bit(row, col)))]
 
-        if in_bounds(r, c) and board[r][c] == player and line:
-            flips.extend(line)
 
-    return flips
+def get_valid_moves(board: Sequence[Sequence[int]], player: int) -> List[Tuple[int, int]]:
+    p, o = list_to_bb(board, player)
+    return [bit_to_square(bit) for bit in iter_bits(generate_moves(p, o))]
 
 
-def get_valid_moves(board: List[List[int]], player: int) -> List[Tuple[int, int]]:
-    moves = []
-    for r in range(8):
-        for c in range(8):
-            if get_flips(board, player, r, c):
-                moves.append((r, c))
-    return moves
+def get_valid_moves_both(
+    board: Sequence[Sequence[int]], player: int
+) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    """Valid moves for ``player`` and for the opponent from a single bitboard pass"""
+    p, o = list_to_bb(board, player)
+    p_moves, o_moves = generate_moves_both(p, o)
+    return (
+        [bit_to_square(bit) for bit in iter_bits(p_moves)],
+        [bit_to_square(bit) for bit in iter_bits(o_moves)],
+    )
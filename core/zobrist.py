@@ -0,0 +1,55 @@
+"""
+Zobrist hashing for bitboard positions.
+
+Keys are drawn once at import from a private, fixed-seed generator so
+hashes are reproducible across processes without touching the global
+``random`` state. Side 0 is black (player 1), side 1 is white (player -1).
+"""
+
+import random
+from typing import Tuple
+
+_rng = random.Random(0x07E110)
+
+# ZOBRIST[side][square]
+ZOBRIST: Tuple[Tuple[int, ...], Tuple[int, ...]] = (
+    tuple(_rng.getrandbits(64) for _ in range(64)),
+    tuple(_rng.getrandbits(64) for _ in range(64)),
+)
+ZOBRIST_SIDE: int = _rng.getrandbits(64)
+
+# Flipping a disc swaps its colour key for the other one, whichever way
+# it goes, so one precomputed XOR per square covers both directions
+FLIP_KEYS: Tuple[int, ...] = tuple(b ^ w for b, w in zip(*ZOBRIST))
+
+
+def side_of(player: int) -> int:
+    return 0 if player == 1 else 1
+
+
+def zobrist_hash(p: int, o: int, side: int) -> int:
+    """Full hash of a position where ``p`` belongs to ``side``, the side to move"""
+    own_keys = ZOBRIST[side]
+    other_keys = ZOBRIST[side ^ 1]
+    h = ZOBRIST_SIDE if side else 0
+
+    while p:
+        lsb = p & -p
+        h ^= own_keys[lsb.bit_length() - 1]
+        p ^= lsb
+    while o:
+        lsb = o & -o
+        h ^= other_keys[lsb.bit_length() - 1]
+        o ^= lsb
+
+    return h
+
+
+def update_hash(h: int, side: int, move_bit: int, flipped: int) -> int:
+    """Hash after ``side`` plays ``move_bit`` flipping ``flipped``; also hands the move over"""
+    h ^= ZOBRIST[side][move_bit.bit_length() - 1] ^ ZOBRIST_SIDE
+    while flipped:
+        lsb = flipped & -flipped
+        h ^= FLIP_KEYS[lsb.bit_length() - 1]
+        flipped ^= lsb
+    return h
@@ -1,8 +1,14 @@
+import random
+
 import pytest
 
+from core.bitboard import generate_moves, flip, iter_bits
+from core.board import apply_move
+from core.rules import get_valid_moves
 
-@pytest.fixture
-def initial_board():
+
+@pytest.fixture(scope="session")
+def _initial_position():
     board = [[0] * 8 for _ in range(8)]
 
     # STANDARD OTHELLO START POSITION
@@ -11,4 +17,55 @@ def initial_board():
     board[4][3] = 1
     board[4][4] = -1
 
-    return board
+    return tuple(tuple(row) for row in board)
+
+
+@pytest.fixture
+def initial_board(_initial_position):
+    # Fresh rows per test so tests that mutate the board stay isolated
+    return [list(row) for row in _initial_position]
+
+
+def random_game(board, seed):
+    """
+    Play seeded random legal moves from ``board`` (black first), passing when forced
+    Yields (board, player to move) for every position; the last one is the finished game
+    """
+    rng = random.Random(seed)
+    player = 1
+    while True:
+        moves = get_valid_moves(board, player)
+        if not moves:
+            player = -player
+            moves = get_valid_moves(board, player)
+        yield board, player
+        if not moves:
+            return
+        board, _ = apply_move(board, player, *rng.choice(moves))
+        player = -player
+
+
+def random_position(board, plies, seed):
+    """(board, player to move) after ``plies`` random moves of random_game"""
+    for ply, position in enumerate(random_game(board, seed)):
+        if ply == plies:
+            return position
+    raise ValueError(f"Game ended before {plies} plies")
+
+
+def reference_negamax(p, o, depth, leaf):
+    """Plain negamax without pruning; ``leaf(p, o)`` scores depth-0 and game-over nodes"""
+    if depth == 0:
+        return leaf(p, o)
+    moves = generate_moves(p, o)
+    if not moves:
+        if not generate_moves(o, p):
+            return leaf(p, o)
+        return -reference_negamax(o, p, depth - 1, leaf)
+    best = None
+    for move_bit in iter_bits(moves):
+        flipped = flip(p, o, move_bit)
+        score = -reference_negamax(o & ~flipped, p | move_bit | flipped, depth - 1, leaf)
+        if best is None or score > best:
+            best = score
+    return best
@@ -0,0 +1,83 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.ai import find_best_move, iterative_deepening, negamax_search, root_split_search
+from core.bitboard import list_to_bb
+from core.board import apply_move
+from core.evaluation import evaluate_bb
+from core.rules import get_valid_moves
+from tests.conftest import random_game, random_position, reference_negamax
+
+
+def _plain_negamax(p, o, depth):
+    return reference_negamax(p, o, depth, evaluate_bb)
+
+
+def test_find_best_move_is_legal(initial_board):
+    move = find_best_move(initial_board, -1, "medium")
+    assert move in get_valid_moves(initial_board, -1)
+
+
+def test_negamax_search_returns_legal_move(initial_board):
+    p, o = list_to_bb(initial_board, 1)
+    _, move = negamax_search(p, o, 3)
+    assert move in get_valid_moves(initial_board, 1)
+
+
+def test_negamax_search_matches_plain_minimax(initial_board):
+    for _, (board, player) in zip(range(14), random_game(initial_board, seed=11)):
+        p, o = list_to_bb(board, player)
+        score, _ = negamax_search(p, o, 3)
+        assert score == pytest.approx(_plain_negamax(p, o, 3))
+
+
+def test_iterative_deepening_matches_fixed_depth(initial_board):
+    board, _ = apply_move(initial_board, 1, 2, 3)
+    p, o = list_to_bb(board, -1)
+    score, _ = iterative_deepening(p, o, 4)
+    assert score == pytest.approx(_plain_negamax(p, o, 4))
+
+
+def test_root_split_search_matches_fixed_depth(initial_board):
+    board, _ = apply_move(initial_board, 1, 2, 3)
+    p, o = list_to_bb(board, -1)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        score, move = root_split_search(p, o, 3, executor)
+    assert score == pytest.approx(_plain_negamax(p, o, 3))
+    assert move in get_valid_moves(board, -1)
+
+
+@pytest.mark.parametrize("plies, seed", [(12, 1), (20, 2), (30, 3)])
+def test_root_split_search_bound_keeps_best_score(initial_board, plies, seed):
+    board, player = random_position(initial_board, plies, seed)
+    p, o = list_to_bb(board, player)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        score, _ = root_split_search(p, o, 3, executor)
+    assert score == pytest.approx(_plain_negamax(p, o, 3))
+
+
+def test_iterative_deepening_upper_bound(initial_board):
+    board, _ = apply_move(initial_board, 1, 2, 3)
+    p, o = list_to_bb(board, -1)
+    exact, _ = iterative_deepening(p, o, 4)
+    assert iterative_deepening(p, o, 4, upper=exact + 1.0)[0] == pytest.approx(exact)
+    assert iterative_deepening(p, o, 4, upper=exact - 1.0)[0] >= exact - 1.0
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.map_calls = 0
+
+    def map(self, *args, **kwargs):
+        self.map_calls += 1
+        return super().map(*args, **kwargs)
+
+
+def test_find_best_move_solves_endgame_without_executor(initial_board):
+    board, player = random_position(initial_board, 57, seed=4)
+    with _CountingExecutor() as executor:
+        move = find_best_move(board, player, "expert", executor)
+    assert move in get_valid_moves(board, player)
+    assert executor.map_calls == 0
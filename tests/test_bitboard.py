@@ -0,0 +1,51 @@
+from core.bitboard import (
+    list_to_bb, bb_to_list, generate_moves, generate_moves_both, flip, iter_bits, bit_to_square
+)
+from core.rules import DIRECTIONS, in_bounds
+from tests.conftest import random_game
+
+
+def _reference_flips(board, player, row, col):
+    """Square-by-square ray walk, independent of the bitboard kernels"""
+    if board[row][col] != 0:
+        return []
+    flips = []
+    for dr, dc in DIRECTIONS:
+        r, c = row + dr, col + dc
+        line = []
+        while in_bounds(r, c) and board[r][c] == -player:
+            line.append((r, c))
+            r += dr
+            c += dc
+        if in_bounds(r, c) and board[r][c] == player and line:
+            flips.extend(line)
+    return flips
+
+
+def _reference_moves(board, player):
+    return [(r, c) for r in range(8) for c in range(8) if _reference_flips(board, player, r, c)]
+
+
+def test_round_trip(initial_board):
+    p, o = list_to_bb(initial_board, -1)
+    assert bb_to_list(p, o, -1) == initial_board
+
+
+def test_initial_moves_match_rules(initial_board):
+    p, o = list_to_bb(initial_board, 1)
+    moves = {bit_to_square(bit) for bit in iter_bits(generate_moves(p, o))}
+    assert moves == set(_reference_moves(initial_board, 1))
+
+
+def test_random_games_match_rules(initial_board):
+    for seed in range(20):
+        for board, player in random_game(initial_board, seed):
+            moves = _reference_moves(board, player)
+            p, o = list_to_bb(board, player)
+            bb_moves = [bit_to_square(bit) for bit in iter_bits(generate_moves(p, o))]
+            assert bb_moves == moves
+            assert generate_moves_both(p, o) == (generate_moves(p, o), generate_moves(o, p))
+
+            for r, c in moves:
+                flipped = flip(p, o, 1 << (r * 8 + c))
+                assert {bit_to_square(bit) for bit in iter_bits(flipped)} == set(_reference_flips(board, player, r, c))
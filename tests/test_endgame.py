@@ -0,0 +1,16 @@
+from core.bitboard import list_to_bb
+from core.endgame import endgame_solve, final_score
+from tests.conftest import random_position, reference_negamax
+
+
+def _exhaustive(p, o):
+    # Every ply fills a square or passes, and passes never come twice in a row
+    return reference_negamax(p, o, 128, final_score)
+
+
+def test_endgame_solve_is_exact(initial_board):
+    # 53 plies from the 60-empty start leaves 7 empties
+    board, player = random_position(initial_board, 53, seed=2)
+    p, o = list_to_bb(board, player)
+    score, _ = endgame_solve(p, o, -64, 64)
+    assert score == _exhaustive(p, o)
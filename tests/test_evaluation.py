@@ -0,0 +1,73 @@
+import pytest
+
+from core.bitboard import generate_moves_both, list_to_bb
+from core.evaluation import (
+    advanced_corner_evaluation,
+    calculate_tempo,
+    enhanced_mobility,
+    enhanced_stability,
+    evaluate_bb,
+    evaluate_position,
+    frontier_discs,
+    game_progress,
+    mobility_bb,
+    smart_parity,
+    tempo_bb,
+)
+from tests.conftest import random_game, random_position
+
+# (seed, plies) -> per player: (corner, mobility, parity, stability, frontier, tempo, total)
+# Recorded from the original square-by-square list implementation.
+GOLDEN = {
+    (1, 10): {
+        1: (5.0, 11.415525, -14.285714, 0.0, 14.285714, 0.0, 25.339306),
+        -1: (-5.0, -11.415525, 14.285714, 0.0, -14.285714, 0.0, -25.339306),
+    },
+    (2, 24): {
+        1: (195.0, -34.95935, 50.0, 100.0, -54.545455, -66.666667, 581.747621),
+        -1: (-195.0, 34.95935, -50.0, -100.0, 54.545455, 66.666667, -581.747621),
+    },
+    (3, 40): {
+        1: (115.0, -8.0, -9.090909, 100.0, 0.0, 100.0, 534.657955),
+        -1: (-115.0, 8.0, 9.090909, -100.0, 0.0, -100.0, -534.657955),
+    },
+    (4, 54): {
+        1: (125.0, 29.032258, -31.034483, 0.0, 44.0, 100.0, 417.769848),
+        -1: (-125.0, -29.032258, 54.310345, 0.0, -44.0, -100.0, -396.566993),
+    },
+}
+
+
+@pytest.mark.parametrize("seed, plies", sorted(GOLDEN))
+def test_heuristics_match_recorded_values(initial_board, seed, plies):
+    board, _ = random_position(initial_board, plies, seed)
+    progress = game_progress(board)
+    for player, expected in GOLDEN[(seed, plies)].items():
+        got = (
+            advanced_corner_evaluation(board, player),
+            enhanced_mobility(board, player),
+            smart_parity(board, player, progress),
+            enhanced_stability(board, player),
+            frontier_discs(board, player),
+            calculate_tempo(board, player),
+            evaluate_position(board, player),
+        )
+        assert got == pytest.approx(expected, abs=1e-5)
+
+
+def test_evaluate_bb_is_evaluate_position_without_tempo(initial_board):
+    for seed in range(10):
+        for board, _ in random_game(initial_board, seed):
+            for side in (1, -1):
+                tempo = 40.0 * (1.0 - game_progress(board)) * calculate_tempo(board, side) / 100.0
+                expected = evaluate_position(board, side) - tempo
+                assert evaluate_bb(*list_to_bb(board, side)) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("seed, plies", sorted(GOLDEN))
+def test_precomputed_moves_match_generated(initial_board, seed, plies):
+    board, _ = random_position(initial_board, plies, seed)
+    p, o = list_to_bb(board, 1)
+    my_moves, opp_moves = generate_moves_both(p, o)
+    assert mobility_bb(p, o, my_moves, opp_moves) == mobility_bb(p, o)
+    assert tempo_bb(p, o, my_moves, opp_moves) == tempo_bb(p, o)
@@ -1,4 +1,7 @@
-from core.game import make_move
+from core.bitboard import list_to_bb
+from core.board import count_discs_bb
+from core.game import make_move, count_discs
+from core.zobrist import side_of, zobrist_hash
 
 
 def test_make_valid_move(initial_board):
@@ -10,3 +13,32 @@ def test_make_valid_move(initial_board):
     assert new_board[3][3] == 1
     assert result["next_player"] == -1
     assert result["game_over"] is False
+
+
+def test_make_move_ends_game_when_neither_side_can_move():
+    board = [[0] * 8 for _ in range(8)]
+    board[0][0] = 1
+    board[0][1] = -1
+
+    result = make_move(board, 1, 0, 2)
+
+    assert result["next_player"] == 1
+    assert result["valid_moves"] == []
+    assert result["game_over"] is True
+    assert result["winner"] == 1
+
+
+def test_count_discs_bb_matches_count_discs(initial_board):
+    board = make_move(initial_board, 1, 2, 3)["board"]
+    black, white = list_to_bb(board, 1)
+    assert count_discs_bb(black, white) == {**count_discs(board), 0: 59}
+
+
+def test_make_move_updates_hash_incrementally(initial_board):
+    board, player = initial_board, 1
+    h = zobrist_hash(*list_to_bb(board, player), side_of(player))
+    for row, col in ((2, 3), (2, 2), (3, 2), (2, 4)):
+        result = make_move(board, player, row, col, position_hash=h)
+        board, player, h = result["board"], result["next_player"], result["hash"]
+        assert h == zobrist_hash(*list_to_bb(board, player), side_of(player))
+    assert "hash" not in make_move(initial_board, 1, 2, 3)
@@ -0,0 +1,127 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+import app.main as main
+from core.rules import get_valid_moves
+
+
+@pytest.fixture
+def thread_pool(monkeypatch):
+    # Threads instead of worker processes keep the handler tests fast
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        monkeypatch.setattr(main, "CPU_POOL", pool)
+        monkeypatch.setattr(main, "_ai_move_cache", main.OrderedDict())
+        yield pool
+
+
+def _ai_move(board, player, difficulty="easy"):
+    req = main.AIMoveRequest(board=board, player=player, difficulty=difficulty)
+    return asyncio.run(main.ai_move(req))
+
+
+def _midgame_board(initial_board):
+    board = [row[:] for row in initial_board]
+    for row, col, cell in ((2, 3, 1), (3, 3, 1), (2, 2, -1), (2, 4, 1), (3, 4, 1),
+                           (4, 5, -1), (4, 4, -1), (5, 4, 1), (4, 2, -1)):
+        board[row][col] = cell
+    return board
+
+
+def test_ai_move_reuses_parent_cache(thread_pool, initial_board):
+    board = _midgame_board(initial_board)
+    first = _ai_move(board, -1)
+    assert (first["move"]["row"], first["move"]["col"]) in get_valid_moves(board, -1)
+
+    # A repeat must not reach the pool at all
+    thread_pool.shutdown()
+    second = _ai_move(board, -1)
+    assert second == first
+
+
+def test_ai_move_does_not_cache_random_openings(thread_pool, initial_board):
+    _ai_move(initial_board, 1)
+    assert not main._ai_move_cache
+
+
+def test_ai_move_passes_when_ai_has_no_moves(thread_pool):
+    board = [[0] * 8 for _ in range(8)]
+    board[0][0] = 1
+    board[0][1] = -1
+    thread_pool.shutdown()  # A pass needs no search
+
+    result = _ai_move(board, -1)
+
+    assert result["move"] is None
+    assert result["next_player"] == 1
+    assert result["valid_moves"] == [{"row": 0, "col": 2}]
+    assert result["game_over"] is False
+    assert result["board"] == board
+
+
+def test_ai_move_reports_game_over(thread_pool):
+    board = [[0] * 8 for _ in range(8)]
+    board[0][0] = -1
+    board[7][7] = -1
+    board[3][3] = 1
+    thread_pool.shutdown()
+
+    result = _ai_move(board, 1)
+
+    assert result["move"] is None
+    assert result["next_player"] is None
+    assert result["valid_moves"] == []
+    assert result["game_over"] is True
+    assert result["winner"] == -1
+
+
+def test_ai_move_plays_a_legal_move(thread_pool, initial_board):
+    board = _midgame_board(initial_board)
+
+    result = _ai_move(board, -1, "medium")
+
+    row, col = result["move"]["row"], result["move"]["col"]
+    assert (row, col) in get_valid_moves(board, -1)
+    assert result["board"][row][col] == -1
+    assert result["flipped"]
+    assert result["next_player"] == 1
+    assert result["valid_moves"] == [
+        {"row": r, "col": c} for r, c in get_valid_moves(result["board"], 1)
+    ]
+
+
+class _CountingPool(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.map_calls = 0
+
+    def map(self, *args, **kwargs):
+        self.map_calls += 1
+        return super().map(*args, **kwargs)
+
+
+def test_ai_move_caches_root_split_replies(monkeypatch, initial_board):
+    board = _midgame_board(initial_board)
+    with _CountingPool() as pool:
+        monkeypatch.setattr(main, "CPU_POOL", pool)
+        monkeypatch.setattr(main, "_ai_move_cache", main.OrderedDict())
+        monkeypatch.setattr(main, "PARALLEL_ROOT_DIFFICULTIES", ("medium",))
+
+        first = _ai_move(board, -1, "medium")
+        second = _ai_move(board, -1, "medium")
+
+    assert second == first
+    assert pool.map_calls == 1
+
+
+def test_ai_move_on_a_real_process_pool(monkeypatch, initial_board):
+    # Catches pickling or worker start-up regressions the thread pool hides
+    board = _midgame_board(initial_board)
+    with ProcessPoolExecutor(max_workers=1, mp_context=main.POOL_CONTEXT) as pool:
+        monkeypatch.setattr(main, "CPU_POOL", pool)
+        monkeypatch.setattr(main, "_ai_move_cache", main.OrderedDict())
+
+        result = _ai_move(board, -1, "medium")
+
+    assert (result["move"]["row"], result["move"]["col"]) in get_valid_moves(board, -1)
@@ -0,0 +1,18 @@
+from core.bitboard import list_to_bb
+from core.board import apply_move
+from core.opening_book import book_move
+from core.rules import get_valid_moves
+
+
+def test_book_covers_every_first_reply(initial_board):
+    for move in get_valid_moves(initial_board, 1):
+        board, _ = apply_move(initial_board, 1, *move)
+        reply = book_move(*list_to_bb(board, -1))
+        assert reply in get_valid_moves(board, -1)
+
+
+def test_book_misses_unknown_position(initial_board):
+    board, _ = apply_move(initial_board, 1, 2, 3)
+    board, _ = apply_move(board, -1, 4, 2)
+    board, _ = apply_move(board, 1, 5, 1)
+    assert book_move(*list_to_bb(board, -1)) is None
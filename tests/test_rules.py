@@ -1,4 +1,4 @@
-from core.rules import get_valid_moves
+from core.rules import get_valid_moves, get_valid_moves_both
 
 
 def test_initial_valid_moves_black(initial_board):
@@ -6,3 +6,13 @@ def test_initial_valid_moves_black(initial_board):
 
     expected = {(2, 3), (3, 2), (4, 5), (5, 4)}
     assert set(moves) == expected
+
+
+def test_valid_moves_both_matches_each_side(initial_board):
+    board = [row[:] for row in initial_board]
+    board[2][3] = 1
+    board[3][3] = 1
+
+    mine, theirs = get_valid_moves_both(board, -1)
+    assert mine == get_valid_moves(board, -1)
+    assert theirs == get_valid_moves(board, 1)
@@ -0,0 +1,16 @@
+from core.bitboard import list_to_bb, generate_moves, flip, iter_bits
+from core.zobrist import zobrist_hash, update_hash
+
+
+def test_incremental_update_matches_full_hash(initial_board):
+    p, o = list_to_bb(initial_board, 1)
+    side = 0
+    h = zobrist_hash(p, o, side)
+
+    for _ in range(6):
+        move_bit = next(iter_bits(generate_moves(p, o)))
+        flipped = flip(p, o, move_bit)
+        h = update_hash(h, side, move_bit, flipped)
+        p, o = o & ~flipped, p | move_bit | flipped
+        side ^= 1
+        assert h == zobrist_hash(p, o, side)